@@ -3,6 +3,7 @@
 from .esat import (
     EPS,
     HPA,
+    EsatLUT,
     coeffs,
     dln_esat_dT,
     degc_to_kelvin,
@@ -27,6 +28,7 @@ __all__ = [
     "kelvin_to_degc",
     "pa_to_hpa",
     "hpa_to_pa",
+    "EsatLUT",
     "EPS",
     "HPA",
     "coeffs",
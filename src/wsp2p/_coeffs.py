@@ -0,0 +1,16 @@
+"""Coefficient constants for the two-pole formulation.
+
+Mirrors ``coeffs.json`` (fit of 2025-11-13) as plain Python floats so that
+importing :mod:`wsp2p` skips ``importlib.resources`` and JSON parsing.
+Set ``WSP2P_LOAD_JSON=1`` to load and validate ``coeffs.json`` instead,
+e.g. when experimenting with a modified coefficient file.
+"""
+
+E0 = 1.810270925564
+A = 269.265582773152
+B = 323.238664916362
+C = -253.834491723435
+D = 333.837330281331
+DOMAIN_MIN = -40.0
+DOMAIN_MAX = 100.0
+DATE = "2025-11-13T18:49:02Z"
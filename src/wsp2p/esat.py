@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
-import json
-from importlib.resources import files
+import math
+import os
 from typing import Any, Dict
 
 import numpy as np
 from numpy.typing import ArrayLike
 
+from . import _coeffs
+
+try:
+    from numba import float32, float64, njit, vectorize
+
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only when numba is absent
+    _HAVE_NUMBA = False
+
+try:
+    import numexpr as ne
+
+    _HAVE_NUMEXPR = True
+except ImportError:  # pragma: no cover - exercised only when numexpr is absent
+    _HAVE_NUMEXPR = False
+
+# Below this size numexpr's evaluate overhead outweighs its blocked,
+# multithreaded evaluation.
+_NUMEXPR_MIN_SIZE = 4096
+
 EPS = 0.621945
 HPA = 100.0
 
 
 def _load_coeffs() -> Dict[str, Any]:
+    import json
+    from importlib.resources import files
+
     coeffs_path = files("wsp2p").joinpath("coeffs.json")
     with coeffs_path.open("r", encoding="utf-8") as fh:
         data: Dict[str, Any] = json.load(fh)
@@ -33,15 +56,225 @@ def _load_coeffs() -> Dict[str, Any]:
     return data
 
 
-coeffs = _load_coeffs()
+# The shipped coefficients live in _coeffs.py as plain constants so import
+# avoids file I/O and JSON parsing; WSP2P_LOAD_JSON=1 restores the validated
+# coeffs.json read for coefficient experiments.
+if os.environ.get("WSP2P_LOAD_JSON") == "1":
+    coeffs = _load_coeffs()
+else:
+    coeffs = {
+        "E0": _coeffs.E0,
+        "a": _coeffs.A,
+        "b": _coeffs.B,
+        "c": _coeffs.C,
+        "d": _coeffs.D,
+        "domain_c": {"min": _coeffs.DOMAIN_MIN, "max": _coeffs.DOMAIN_MAX},
+        "date": _coeffs.DATE,
+    }
+
+# Plain float globals so the JIT kernels below capture them as compile-time
+# constants instead of boxed dict lookups.
+_E0 = coeffs["E0"]
+_A = coeffs["a"]
+_B = coeffs["b"]
+_C = coeffs["c"]
+_D = coeffs["d"]
+_TMIN = coeffs["domain_c"]["min"]
+_TMAX = coeffs["domain_c"]["max"]
+
+# Invariant coefficient products used by the quadratic inverse and the
+# derivative; computed once at import rather than on every call.
+_AC = _A + _C
+_BD = _B + _D
+_BxD = _B * _D
+_ADpCB = _A * _D + _C * _B
+_AB = _A * _B
+_CD = _C * _D
+
+
+# Cody-Waite split of ln(2) so r = x - n*ln2 stays accurate after reduction.
+_LOG2E = 1.4426950408889634
+_LN2_HI = 6.93147180369123816490e-01
+_LN2_LO = 1.90821492927058770002e-10
+
+
+# Persistently cache compiled kernels so short-lived processes skip JIT
+# warmup on every run after the first. The cache stores the captured
+# coefficient constants, so it must stay off when WSP2P_LOAD_JSON may have
+# swapped them for a modified coeffs.json.
+_CACHE_KERNELS = os.environ.get("WSP2P_LOAD_JSON") != "1"
+
+
+if _HAVE_NUMBA:
+
+    @njit(inline="always", fastmath=True)
+    def _fast_exp(x):  # pragma: no cover - compiled
+        # exp(x) = 2^n * exp(r) with r in [-ln2/2, ln2/2]; the reduced
+        # exponential is a degree-10 Horner polynomial, accurate to ~1e-13
+        # relative, well inside what the inverse round-trip tolerates.
+        n = math.floor(x * _LOG2E + 0.5)
+        r = x - n * _LN2_HI - n * _LN2_LO
+        p = 2.7557319223985893e-07
+        p = p * r + 2.7557319223985888e-06
+        p = p * r + 2.4801587301587302e-05
+        p = p * r + 1.984126984126984e-04
+        p = p * r + 1.3888888888888889e-03
+        p = p * r + 8.333333333333333e-03
+        p = p * r + 4.1666666666666664e-02
+        p = p * r + 1.6666666666666666e-01
+        p = p * r + 0.5
+        p = p * r + 1.0
+        p = p * r + 1.0
+        return math.ldexp(p, int(n))
+
+    @njit(inline="always", fastmath=True)
+    def _ln_esat(T):  # pragma: no cover - compiled
+        return _E0 + (_A * T) / (_B + T) + (_C * T) / (_D + T)
+
+    @njit(inline="always", fastmath=True)
+    def _invert_ln_esat(y):  # pragma: no cover - compiled
+        # Closed-form root of the two-pole form for y = ln(es) - E0.
+        A = y - _AC
+        B = y * _BD - _ADpCB
+        C = y * _BxD
+        disc = max(B * B - 4.0 * A * C, 0.0)
+        # copysign keeps the sign selection branchless.
+        q = -0.5 * (B + math.copysign(math.sqrt(disc), B))
+        return min(max(C / q, _TMIN), _TMAX)
+
+    @vectorize(
+        [float32(float32), float64(float64)],
+        target="parallel",
+        fastmath=True,
+        cache=_CACHE_KERNELS,
+    )
+    def _esat_kernel(T):  # pragma: no cover - compiled
+        # exp never goes negative, so no positivity clamp is needed.
+        return _fast_exp(_ln_esat(T))
+
+    @vectorize(
+        [float32(float32), float64(float64)],
+        target="parallel",
+        fastmath=True,
+        cache=_CACHE_KERNELS,
+    )
+    def _dln_esat_kernel(T):  # pragma: no cover - compiled
+        term_a = _AB / ((_B + T) * (_B + T))
+        term_c = _CD / ((_D + T) * (_D + T))
+        return term_a + term_c
+
+    @vectorize(
+        [float32(float32), float64(float64)],
+        target="parallel",
+        fastmath=True,
+        cache=_CACHE_KERNELS,
+    )
+    def _solve_quadratic_kernel(y):  # pragma: no cover - compiled
+        return _invert_ln_esat(y)
+
+    @vectorize(
+        [float32(float32, float32), float64(float64, float64)],
+        target="parallel",
+        fastmath=True,
+        cache=_CACHE_KERNELS,
+    )
+    def _rh_kernel(T, e):  # pragma: no cover - compiled
+        rh = e / _fast_exp(_ln_esat(T)) * 100.0
+        return min(max(rh, 0.0), 100.0)
+
+    @vectorize(
+        [float32(float32, float32), float64(float64, float64)],
+        target="parallel",
+        fastmath=True,
+        cache=_CACHE_KERNELS,
+    )
+    def _dewpoint_kernel(T, rh):  # pragma: no cover - compiled
+        rh = min(rh, 100.0)
+        if not rh > 0.0:
+            return math.nan
+        # ln(e) - E0 = ln(es) - E0 + ln(rh/100); no exp/log round-trip.
+        y = _ln_esat(T) - _E0 + math.log(rh * 0.01)
+        return _invert_ln_esat(y)
+
+    @vectorize(
+        [float32(float32, float32, float32), float64(float64, float64, float64)],
+        target="parallel",
+        fastmath=True,
+        cache=_CACHE_KERNELS,
+    )
+    def _specific_humidity_kernel(T, rh, p):  # pragma: no cover - compiled
+        rh = min(max(rh, 0.0), 100.0)
+        p = max(p, 1.0)
+        e = _fast_exp(_ln_esat(T)) * (rh * 0.01)
+        # the clamp guards p < (1 - EPS) * e, where the denominator flips
+        return max(EPS * e / (p - (1.0 - EPS) * e), 0.0)
+
+
+# Scalar inputs skip ufunc dispatch entirely and run through math.*.
+_SCALAR_TYPES = (int, float, np.floating)
+
+
+def _ln_esat_scalar(T: float) -> float:
+    return _E0 + (_A * T) / (_B + T) + (_C * T) / (_D + T)
+
+
+def _invert_ln_esat_scalar(y: float) -> float:
+    A = y - _AC
+    B = y * _BD - _ADpCB
+    C = y * _BxD
+    disc = max(B * B - 4.0 * A * C, 0.0)
+    q = -0.5 * (B + math.copysign(math.sqrt(disc), B))
+    return min(max(C / q, _TMIN), _TMAX)
 
 
 def _as_float_array(value: ArrayLike) -> np.ndarray:
-    return np.asarray(value, dtype=np.float64)
+    # Preserve float32 and float64 inputs so bulk gridded callers keep the
+    # narrower dtype end to end; everything else (ints, float16, longdouble)
+    # is converted to float64, the only other dtype the kernels have loops
+    # for.
+    arr = np.asarray(value)
+    if arr.dtype == np.float32 or arr.dtype == np.float64:
+        return arr
+    return arr.astype(np.float64)
+
+
+def _array_namespace(*values: Any) -> Any:
+    """
+    Return the array namespace (numpy, cupy, ...) of the first non-numpy
+    array argument; everything else (ndarrays, scalars, lists) maps to numpy.
+    """
+    for value in values:
+        if isinstance(value, (np.ndarray, *_SCALAR_TYPES)):
+            continue
+        if type(value).__module__.partition(".")[0] == "cupy":
+            import cupy
+
+            return cupy
+        namespace = getattr(value, "__array_namespace__", None)
+        if namespace is not None:
+            return namespace()
+    return np
+
+
+def _ln_esat_xp(T: Any, xp: Any) -> Any:
+    return _E0 + (_A * T) / (_B + T) + (_C * T) / (_D + T)
+
+
+def _invert_ln_esat_xp(y: Any, xp: Any) -> Any:
+    A = y - _AC
+    B = y * _BD - _ADpCB
+    C = y * _BxD
+    sqrt_disc = xp.sqrt(xp.maximum(B * B - 4.0 * A * C, 0.0))
+    q = -0.5 * (B + xp.copysign(sqrt_disc, B))
+    return xp.clip(C / q, _TMIN, _TMAX)
 
 
 def _clip_temperature(T: np.ndarray) -> np.ndarray:
-    return np.clip(T, coeffs["domain_c"]["min"], coeffs["domain_c"]["max"])
+    # Two dedicated in-place passes instead of np.clip's generic three-operand
+    # path; the only caller passes a freshly allocated buffer, safe to mutate.
+    np.minimum(T, _TMAX, out=T)
+    np.maximum(T, _TMIN, out=T)
+    return T
 
 
 def degc_to_kelvin(T_c: ArrayLike) -> np.ndarray:
@@ -64,7 +297,7 @@ def hpa_to_pa(p_hpa: ArrayLike) -> np.ndarray:
     return _as_float_array(p_hpa) * HPA
 
 
-def esat_water_hpa(T_c: ArrayLike) -> np.ndarray:
+def esat_water_hpa(T_c: ArrayLike) -> float | np.ndarray:
     """
     Saturated vapor pressure over liquid/supercooled water (hPa).
 
@@ -73,91 +306,246 @@ def esat_water_hpa(T_c: ArrayLike) -> np.ndarray:
     T_c : ArrayLike
         Temperature in degrees Celsius. Valid for coeffs["domain_c"].
     """
-    T = _as_float_array(T_c)
-    denom_b = coeffs["b"] + T
-    denom_d = coeffs["d"] + T
-    ln_es = coeffs["E0"] + (coeffs["a"] * T) / denom_b + (coeffs["c"] * T) / denom_d
-    es = np.exp(ln_es)
-    # enforce positivity
-    return np.maximum(es, 0.0)
+    if isinstance(T_c, _SCALAR_TYPES):
+        return math.exp(_ln_esat_scalar(T_c))
+    xp = _array_namespace(T_c)
+    if xp is not np:
+        return xp.exp(_ln_esat_xp(xp.asarray(T_c), xp))
+    return _esat_from_arr(_as_float_array(T_c))
+
+
+def _esat_from_arr(T: np.ndarray) -> np.ndarray:
+    # Array core of esat_water_hpa for callers that already hold a float
+    # ndarray; skips the coercion the public entry point repeats.
+    if _HAVE_NUMBA:
+        # _fast_exp's float->int conversion flags FP-invalid on NaN lanes;
+        # keep NaN inputs silent like np.exp.
+        with np.errstate(invalid="ignore"):
+            return _esat_kernel(T)
+    if _HAVE_NUMEXPR and T.size >= _NUMEXPR_MIN_SIZE:
+        es = ne.evaluate(
+            "exp(E0 + a * T / (b + T) + c * T / (d + T))",
+            local_dict={"T": T, "E0": _E0, "a": _A, "b": _B, "c": _C, "d": _D},
+        )
+        return es.astype(T.dtype, copy=False)
+    # Accumulate into two buffers instead of one temporary per term.
+    out = np.empty_like(T)
+    tmp = np.empty_like(T)
+    np.add(T, _B, out=out)
+    np.divide(T, out, out=out)
+    out *= _A
+    np.add(T, _D, out=tmp)
+    np.divide(T, tmp, out=tmp)
+    tmp *= _C
+    out += tmp
+    out += _E0
+    # exp never goes negative, so no positivity clamp is needed.
+    np.exp(out, out=out)
+    return out
 
 
-def dln_esat_dT(T_c: ArrayLike) -> np.ndarray:
+def dln_esat_dT(T_c: ArrayLike) -> float | np.ndarray:
     """Derivative of ln(Es) with respect to temperature."""
+    if isinstance(T_c, _SCALAR_TYPES):
+        denom_b = _B + T_c
+        denom_d = _D + T_c
+        return _AB / (denom_b * denom_b) + _CD / (denom_d * denom_d)
+    xp = _array_namespace(T_c)
+    if xp is not np:
+        T = xp.asarray(T_c)
+        denom_b = _B + T
+        denom_d = _D + T
+        return _AB / (denom_b * denom_b) + _CD / (denom_d * denom_d)
     T = _as_float_array(T_c)
-    term_a = coeffs["a"] * coeffs["b"] / ((coeffs["b"] + T) ** 2)
-    term_c = coeffs["c"] * coeffs["d"] / ((coeffs["d"] + T) ** 2)
-    return term_a + term_c
+    if _HAVE_NUMBA:
+        return _dln_esat_kernel(T)
+    if _HAVE_NUMEXPR and T.size >= _NUMEXPR_MIN_SIZE:
+        dln = ne.evaluate(
+            "ab / ((b + T) ** 2) + cd / ((d + T) ** 2)",
+            local_dict={"T": T, "ab": _AB, "b": _B, "cd": _CD, "d": _D},
+        )
+        return dln.astype(T.dtype, copy=False)
+    out = np.empty_like(T)
+    tmp = np.empty_like(T)
+    np.add(T, _B, out=out)
+    out *= out
+    np.divide(_AB, out, out=out)
+    np.add(T, _D, out=tmp)
+    tmp *= tmp
+    np.divide(_CD, tmp, out=tmp)
+    out += tmp
+    return out
 
 
 def _solve_quadratic(y: np.ndarray) -> np.ndarray:
-    y = np.asarray(y, dtype=np.float64)
-
-    a = coeffs["a"]
-    b = coeffs["b"]
-    c = coeffs["c"]
-    d = coeffs["d"]
+    y = _as_float_array(y)
+    if _HAVE_NUMBA:
+        return _solve_quadratic_kernel(y)
 
-    a_coef = a + c
-    A = y - a_coef
-    B = y * (b + d) - (a * d + c * b)
-    C = y * b * d
+    A = y - _AC
+    B = y * _BD
+    B -= _ADpCB
+    C = y * _BxD
 
-    disc = np.maximum(B * B - 4.0 * A * C, 0.0)
-    sqrt_disc = np.sqrt(disc)
-    sign_B = np.where(B >= 0.0, 1.0, -1.0)
+    # disc = max(B^2 - 4AC, 0); A is dead after this so reuse its buffer.
+    disc = B * B
+    A *= C
+    A *= 4.0
+    disc -= A
+    np.maximum(disc, 0.0, out=disc)
+    np.sqrt(disc, out=disc)
 
-    q = -0.5 * (B + sign_B * sqrt_disc)
+    np.copysign(disc, B, out=disc)
+    disc += B
+    disc *= -0.5  # q = -(B + sign(B) * sqrt(disc)) / 2
 
-    T = C / q
-    return _clip_temperature(T)
+    np.divide(C, disc, out=disc)
+    return _clip_temperature(disc)
 
 
-def T_from_e_water(e_hpa: ArrayLike) -> np.ndarray:
+def T_from_e_water(e_hpa: ArrayLike) -> float | np.ndarray:
     """
     Closed-form inverse that returns temperature (°C) from vapor pressure (hPa).
     """
+    if isinstance(e_hpa, _SCALAR_TYPES):
+        e = float(e_hpa)
+        if not (math.isfinite(e) and e > 0.0):
+            return math.nan
+        return _invert_ln_esat_scalar(math.log(e) - _E0)
+    xp = _array_namespace(e_hpa)
+    if xp is not np:
+        e = xp.asarray(e_hpa)
+        valid = xp.isfinite(e) & (e > 0.0)
+        y = xp.log(xp.where(valid, e, 1.0)) - _E0
+        return xp.where(valid, _invert_ln_esat_xp(y, xp), xp.nan)
     e = _as_float_array(e_hpa)
-    out = np.full_like(e, np.nan, dtype=np.float64)
-    valid = np.isfinite(e) & (e > 0.0)
-    if not np.any(valid):
-        return out
-    y = np.log(e[valid]) - coeffs["E0"]
-    T_sol = _solve_quadratic(y)
-    out[valid] = T_sol
-    return out
+    # Let log produce nan/-inf for invalid inputs and push everything through
+    # the branch-free quadratic; validity is checked once at the end instead
+    # of via an up-front mask pass feeding a masked log.
+    with np.errstate(invalid="ignore", divide="ignore"):
+        y = np.log(e)
+        y -= _E0
+        T_sol = _solve_quadratic(y)
+    return np.where(np.isfinite(e) & (e > 0.0), T_sol, np.nan)
 
 
-def rh_percent(T_c: ArrayLike, e_hpa: ArrayLike) -> np.ndarray:
+def rh_percent(T_c: ArrayLike, e_hpa: ArrayLike) -> float | np.ndarray:
     """Relative humidity (%) computed without iteration."""
+    if isinstance(T_c, _SCALAR_TYPES) and isinstance(e_hpa, _SCALAR_TYPES):
+        rh = e_hpa / math.exp(_ln_esat_scalar(T_c)) * 100.0
+        return min(max(rh, 0.0), 100.0)
+    xp = _array_namespace(T_c, e_hpa)
+    if xp is not np:
+        es = xp.exp(_ln_esat_xp(xp.asarray(T_c), xp))
+        rh = xp.asarray(e_hpa) / es * 100.0
+        return xp.clip(rh, 0.0, 100.0)
     T = _as_float_array(T_c)
     e = _as_float_array(e_hpa)
-    es = esat_water_hpa(T)
-    rh = np.where(es > 0.0, (e / es) * 100.0, 0.0)
+    if _HAVE_NUMBA:
+        # NaN inputs pass through silently, without warnings or FP signals.
+        with np.errstate(invalid="ignore"):
+            return _rh_kernel(T, e)
+    # es > 0 always, so no zero-division guard is needed; NaN inputs
+    # propagate to NaN output, matching the kernel/scalar/xp paths.
+    es = _esat_from_arr(T)
+    rh = (e / es) * 100.0
     return np.clip(rh, 0.0, 100.0)
 
 
-def dewpoint_c_from_T_RH(T_c: ArrayLike, rh_percent_values: ArrayLike) -> np.ndarray:
+def dewpoint_c_from_T_RH(T_c: ArrayLike, rh_percent_values: ArrayLike) -> float | np.ndarray:
     """Return dewpoint °C from ambient temperature and RH%."""
+    if isinstance(T_c, _SCALAR_TYPES) and isinstance(rh_percent_values, _SCALAR_TYPES):
+        rh = min(float(rh_percent_values), 100.0)
+        if not rh > 0.0:
+            return math.nan
+        y = _ln_esat_scalar(T_c) - _E0 + math.log(rh * 0.01)
+        return _invert_ln_esat_scalar(y)
+    xp = _array_namespace(T_c, rh_percent_values)
+    if xp is not np:
+        T = xp.asarray(T_c)
+        rh = xp.minimum(xp.asarray(rh_percent_values), 100.0)
+        valid = rh > 0.0
+        y = _ln_esat_xp(T, xp) - _E0 + xp.log(xp.where(valid, rh * 0.01, 1.0))
+        return xp.where(valid, _invert_ln_esat_xp(y, xp), xp.nan)
     T = _as_float_array(T_c)
-    rh = np.clip(_as_float_array(rh_percent_values), 0.0, 100.0)
-    es = esat_water_hpa(T)
-    e = es * (rh / 100.0)
-    return T_from_e_water(e)
+    if _HAVE_NUMBA:
+        with np.errstate(invalid="ignore"):
+            return _dewpoint_kernel(T, _as_float_array(rh_percent_values))
+    rh = np.minimum(_as_float_array(rh_percent_values), 100.0)
+    valid = rh > 0.0
+    # ln(e) - E0 = ln(es) - E0 + ln(rh/100): the exp from esat and the log
+    # from T_from_e_water cancel, so build y directly in log space.
+    y = _A * T / (_B + T) + _C * T / (_D + T)
+    y += np.log(np.where(valid, rh * 0.01, 1.0))
+    with np.errstate(invalid="ignore"):
+        T_d = _solve_quadratic(y)
+    return np.where(valid, T_d, np.nan)
 
 
 def specific_humidity_kg_per_kg(
     T_c: ArrayLike,
     rh_percent_values: ArrayLike,
     p_hpa: ArrayLike,
-) -> np.ndarray:
+) -> float | np.ndarray:
     """
     Specific humidity (kg/kg of moist air) using EPS ratio, no iteration required.
     """
+    if (
+        isinstance(T_c, _SCALAR_TYPES)
+        and isinstance(rh_percent_values, _SCALAR_TYPES)
+        and isinstance(p_hpa, _SCALAR_TYPES)
+    ):
+        rh = min(max(float(rh_percent_values), 0.0), 100.0)
+        p = max(float(p_hpa), 1.0)
+        e = math.exp(_ln_esat_scalar(T_c)) * (rh * 0.01)
+        return max(EPS * e / (p - (1.0 - EPS) * e), 0.0)
+    xp = _array_namespace(T_c, rh_percent_values, p_hpa)
+    if xp is not np:
+        rh = xp.clip(xp.asarray(rh_percent_values), 0.0, 100.0)
+        p = xp.maximum(xp.asarray(p_hpa), 1.0)
+        e = xp.exp(_ln_esat_xp(xp.asarray(T_c), xp)) * (rh / 100.0)
+        return xp.maximum(EPS * e / (p - (1.0 - EPS) * e), 0.0)
     T = _as_float_array(T_c)
+    if _HAVE_NUMBA:
+        with np.errstate(invalid="ignore"):
+            return _specific_humidity_kernel(
+                T, _as_float_array(rh_percent_values), _as_float_array(p_hpa)
+            )
     rh = np.clip(_as_float_array(rh_percent_values), 0.0, 100.0)
     p = np.maximum(_as_float_array(p_hpa), 1.0)  # avoid zero/negative pressure
-    e = esat_water_hpa(T) * (rh / 100.0)
+    e = _esat_from_arr(T) * (rh / 100.0)
+    # the clamp guards p < (1 - EPS) * e, where the denominator flips sign;
+    # reusing e's buffer keeps it from costing an extra allocation
     denom = p - (1.0 - EPS) * e
-    q = EPS * e / denom
-    return np.clip(q, 0.0, None)
+    np.multiply(e, EPS, out=e)
+    np.divide(e, denom, out=e)
+    return np.maximum(e, 0.0, out=e)
+
+
+class EsatLUT:
+    """
+    Linear-interpolation lookup table for `esat_water_hpa` on a fixed grid.
+
+    Pays one up-front evaluation over ``n`` points, after which each sample
+    is an O(1) gather plus a fused multiply-add — useful for fixed-grid
+    workloads such as radiosonde or reanalysis post-processing. At the
+    default 0.01 °C spacing the second-order interpolation error is orders
+    of magnitude below the formulation's 5e-4 relative tolerance.
+    """
+
+    def __init__(
+        self, lo: float = _TMIN, hi: float = _TMAX, n: int = 14001
+    ) -> None:
+        self.lo = float(lo)
+        self.hi = float(hi)
+        self.step = (self.hi - self.lo) / (n - 1)
+        self.table = esat_water_hpa(np.linspace(self.lo, self.hi, n))
+
+    def __call__(self, T_c: ArrayLike) -> np.ndarray:
+        T = _as_float_array(T_c)
+        # Out-of-domain temperatures clamp to the table endpoints, matching
+        # the domain clip applied by the closed-form inverse.
+        i = np.clip((T - self.lo) / self.step, 0.0, self.table.size - 1.0)
+        i0 = np.minimum(i.astype(np.int64), self.table.size - 2)
+        frac = i - i0
+        return self.table[i0] * (1.0 - frac) + self.table[i0 + 1] * frac
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from wsp2p.esat import (
+    EsatLUT,
     degc_to_kelvin,
     dewpoint_c_from_T_RH,
     dln_esat_dT,
@@ -30,23 +31,49 @@ def test_pressure_conversion_roundtrip():
     np.testing.assert_allclose(hpa_to_pa(hpa), pressures_pa)
 
 
-@pytest.mark.parametrize(
-    "temp_c, expected",
+REFERENCE_TEMPS_C = np.array([-40.0, -20.0, -5.0, 0.0, 15.0, 30.0, 60.0, 100.0])
+REFERENCE_ESAT_HPA = np.array(
     [
-        (-40.0, 0.18976374741735924),
-        (-20.0, 1.2550003635784304),
-        (-5.0, 4.217682579377076),
-        (0.0, 6.112103132923173),
-        (15.0, 17.05794023929115),
-        (30.0, 42.469730025405646),
-        (60.0, 199.46414287870633),
-        (100.0, 1013.7393292898188),
-    ],
+        0.18976374741735924,
+        1.2550003635784304,
+        4.217682579377076,
+        6.112103132923173,
+        17.05794023929115,
+        42.469730025405646,
+        199.46414287870633,
+        1013.7393292898188,
+    ]
 )
 
-def test_esat_water_matches_reference_table(temp_c, expected):
-    computed = esat_water_hpa(temp_c)
-    np.testing.assert_allclose(computed, expected, rtol=5e-4)
+
+def test_esat_water_matches_reference_table():
+    computed = esat_water_hpa(REFERENCE_TEMPS_C)
+    np.testing.assert_allclose(computed, REFERENCE_ESAT_HPA, rtol=5e-4)
+
+
+def test_esat_water_scalar_call_matches_reference():
+    computed = esat_water_hpa(0.0)
+    assert isinstance(computed, float)
+    np.testing.assert_allclose(computed, 6.112103132923173, rtol=5e-4)
+
+
+def test_float32_inputs_stay_float32():
+    temps = np.array([-40.0, -5.0, 0.0, 30.0, 100.0], dtype=np.float32)
+    es = esat_water_hpa(temps)
+    assert es.dtype == np.float32
+    np.testing.assert_allclose(
+        es, esat_water_hpa(temps.astype(np.float64)), rtol=5e-4
+    )
+    recovered = T_from_e_water(es)
+    assert recovered.dtype == np.float32
+    np.testing.assert_allclose(recovered, temps, atol=5e-3)
+
+
+def test_esat_nan_input_propagates_silently():
+    with np.errstate(invalid="raise"):
+        out = esat_water_hpa(np.array([np.nan, 20.0]))
+    assert np.isnan(out[0])
+    np.testing.assert_allclose(out[1], esat_water_hpa(20.0), rtol=5e-4)
 
 
 def test_dln_esat_matches_finite_difference():
@@ -86,6 +113,20 @@ def test_rh_percent_behaves_expected():
     np.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_rh_percent_nan_temperature_propagates(monkeypatch, use_numba):
+    from wsp2p import esat as esat_module
+
+    if use_numba and not esat_module._HAVE_NUMBA:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(esat_module, "_HAVE_NUMBA", use_numba)
+    result = esat_module.rh_percent(
+        np.array([np.nan, 22.0]), np.array([5.0, 21.691850907414768])
+    )
+    assert np.isnan(result[0])
+    np.testing.assert_allclose(result[1], 82.0)
+
+
 def test_dewpoint_from_T_RH_matches_reference():
     temp = np.array([30.0])
     rh = np.array([35.0])
@@ -94,6 +135,48 @@ def test_dewpoint_from_T_RH_matches_reference():
     np.testing.assert_allclose(dew, expected, atol=1e-6)
 
 
+def _cupy_available() -> bool:
+    try:
+        import cupy
+
+        cupy.zeros(1)
+    except Exception:
+        return False
+    return True
+
+
+@pytest.mark.skipif(not _cupy_available(), reason="cupy not available")
+def test_cupy_arrays_dispatch_to_gpu_namespace():
+    import cupy
+
+    temps = np.linspace(-40.0, 100.0, 1001)
+    es_gpu = esat_water_hpa(cupy.asarray(temps))
+    assert isinstance(es_gpu, cupy.ndarray)
+    np.testing.assert_allclose(cupy.asnumpy(es_gpu), esat_water_hpa(temps), rtol=5e-4)
+    back = T_from_e_water(es_gpu)
+    np.testing.assert_allclose(cupy.asnumpy(back), temps, atol=1e-5)
+
+
+def test_specific_humidity_clamped_nonnegative():
+    # hot, saturated air at an absurdly low pressure flips the denominator;
+    # the result must clamp to 0 rather than go negative
+    assert specific_humidity_kg_per_kg(40.0, 100.0, 10.0) == 0.0
+    q = specific_humidity_kg_per_kg(
+        np.array([40.0]), np.array([100.0]), np.array([10.0])
+    )
+    np.testing.assert_allclose(q, np.array([0.0]))
+
+
+def test_esat_lut_matches_direct_evaluation():
+    lut = EsatLUT()
+    temps = np.linspace(-39.987, 99.987, 777)
+    np.testing.assert_allclose(lut(temps), esat_water_hpa(temps), rtol=5e-4)
+    # out-of-domain inputs clamp to the table endpoints
+    np.testing.assert_allclose(
+        lut(np.array([-60.0, 150.0])), esat_water_hpa(np.array([-40.0, 100.0]))
+    )
+
+
 def test_specific_humidity_expected_value():
     temp = np.array([28.0])
     rh = np.array([65.0])
@@ -21,16 +21,20 @@ SC_MAX_PCT = 0.339598 * BENCHMARK_MARGIN
 EPS = np.finfo(np.float64).eps
 
 
-def test_inverse_accuracy():
-    es = esat_water_hpa(GRID)
-    back = T_from_e_water(es)
+@pytest.fixture(scope="module")
+def es_grid() -> np.ndarray:
+    # Shared across the grid tests so esat_water_hpa(GRID) runs once.
+    return esat_water_hpa(GRID)
+
+
+def test_inverse_accuracy(es_grid):
+    back = T_from_e_water(es_grid)
     delta = np.max(np.abs(back - GRID))
     assert delta < 1e-6, f"Inverse drift {delta:.3e} °C"
 
 
-def test_monotonicity():
-    es = esat_water_hpa(GRID)
-    diffs = np.diff(es)
+def test_monotonicity(es_grid):
+    diffs = np.diff(es_grid)
     assert np.all(diffs > 0.0), "Es(T) must be strictly increasing"
 
 